@@ -1,7 +1,7 @@
 from .controller import Controller, controller, as_api_router
 from .controller import get, post, patch, put, delete, head, trace, options
 
-__version__ = "0.0.2"
+__version__ = "0.1.1"
 
 __all__ = [
     "Controller",
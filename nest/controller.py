@@ -1,21 +1,95 @@
+from __future__ import annotations
+
 import inspect
-from collections import namedtuple
-from functools import wraps
-from typing import TypeVar, Type, Callable, overload
+import types
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar, Type, Callable, overload
 
-from fastapi import APIRouter
-from fastapi.params import Depends
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from fastapi.params import Depends
 
 T = TypeVar("T")
 
-RouteMeta = namedtuple("RouteMeta", ("method", "path", "args", "kwargs"))
+_APIRouter = None
+
+_Depends = None
+
+
+def _apirouter() -> Type[APIRouter]:
+    """
+    Import and cache fastapi's APIRouter on first use
+    """
+    global _APIRouter
+    if _APIRouter is None:
+        from fastapi import APIRouter
+        _APIRouter = APIRouter
+    return _APIRouter
+
+
+def _depends_cls() -> Type[Depends]:
+    """
+    Import and cache fastapi's Depends class on first use
+    """
+    global _Depends
+    if _Depends is None:
+        from fastapi.params import Depends
+        _Depends = Depends
+    return _Depends
+
+
+class RouteMeta:
+    """
+    Metadata attached to a route method by the Method decorators
+    """
+    __slots__ = ("method", "path", "args", "kwargs")
+
+    def __init__(self, method, path, args, kwargs):
+        self.method = method
+        self.path = path
+        self.args = args
+        self.kwargs = kwargs
 
 
 def is_depends(instance: object) -> bool:
     """
     Check if an object is a Depends instance
+
+    Public helper; internal call sites inline the isinstance check.
     """
-    return isinstance(instance, Depends)
+    return isinstance(instance, _depends_cls())
+
+
+# Parameters for Depends fields shared through a common base class are
+# identical across controllers; intern them so each is built once. The
+# cached Parameter holds a reference to the default, keeping its id stable.
+_PARAM_CACHE: dict[tuple, inspect.Parameter] = {}
+
+# Assembled Depends parameter tuples keyed by the full field set, so
+# controller hierarchies with identical Depends fields build them once
+_DEPEND_PARAMS_CACHE: dict[tuple, tuple] = {}
+
+
+def _fast_signature(parameters, return_annotation) -> inspect.Signature:
+    """
+    Build a Signature from already-validated parameters, skipping the
+    kind-ordering checks in Signature.__init__
+
+    Duplicate names are still rejected: a route method parameter may
+    collide with a Depends field, and the dict build would otherwise
+    silently drop one of the two.
+    """
+    params_map = {parameter.name: parameter for parameter in parameters}
+    if len(params_map) != len(parameters):
+        seen = set()
+        for parameter in parameters:
+            if parameter.name in seen:
+                raise ValueError(f"duplicate parameter name: {parameter.name!r}")
+            seen.add(parameter.name)
+    signature = inspect.Signature.__new__(inspect.Signature)
+    signature._parameters = types.MappingProxyType(params_map)
+    signature._return_annotation = return_annotation
+    return signature
 
 
 _CONTROLLER_ROUTER_KEY = "_controller_router_"
@@ -26,17 +100,56 @@ _ROUTER_META_KEY = "_router_meta_"
 def is_controller(instance: object) -> bool:
     """
     Check if an object is a controller
+
+    Public helper; internal call sites inline the hasattr check.
     """
     return hasattr(instance, _CONTROLLER_ROUTER_KEY)
 
 
+def _sync_dispatch(method, depends_names, controller_key, /, *args, **kwargs):
+    """
+    Handle a sync route; bound to its method via functools.partial
+    """
+    # Get the controller instance
+    _controller = kwargs.pop(controller_key)
+
+    # Move the resolved Depends values onto the controller via its instance
+    # dict, avoiding one setattr descriptor walk per field
+    if depends_names:
+        controller_dict = _controller.__dict__
+        for field_name in depends_names:
+            controller_dict[field_name] = kwargs.pop(field_name)
+    # Call the method
+    return method(self=_controller, *args, **kwargs)
+
+
+async def _async_dispatch(method, depends_names, controller_key, /, *args, **kwargs):
+    """
+    Handle an async route; bound to its method via functools.partial
+    """
+    # Get the controller instance
+    _controller = kwargs.pop(controller_key)
+
+    # Move the resolved Depends values onto the controller via its instance
+    # dict, avoiding one setattr descriptor walk per field
+    if depends_names:
+        controller_dict = _controller.__dict__
+        for field_name in depends_names:
+            controller_dict[field_name] = kwargs.pop(field_name)
+    # Call the method
+    return await method(self=_controller, *args, **kwargs)
+
+
 class Controller:
     """
     Decorate a class as a controller
     """
 
     def __init__(self, *args, **kwargs):
-        self._router = APIRouter(*args, **kwargs)
+        # Defer APIRouter construction (and the fastapi import behind it)
+        # until a class is actually decorated
+        self._router_args = (args, kwargs)
+        self._router = None
 
     def __call__(self, kls: Type[T]) -> Type[T]:
         """
@@ -44,93 +157,129 @@ class Controller:
         """
         assert inspect.isclass(kls), "Controller must be a class"
 
+        # Decorating the same class twice (e.g. during a dev-server reload)
+        # is a no-op instead of rebuilding every route
+        if _CONTROLLER_ROUTER_KEY in kls.__dict__:
+            return kls
+
         controller_key = f"_{kls.__name__}__self"
 
-        # Get all the fields that are Depends instances
-        field_depends = inspect.getmembers(kls, is_depends)
+        # Walk the MRO once, collecting the Depends fields and the plain
+        # functions without triggering the descriptor protocol for every name
+        depends_cls = _depends_cls()
+
+        seen = set()
+        field_depends = []
+        route_methods = []
+        for base in kls.__mro__:
+            for name, value in vars(base).items():
+                if name.startswith("__") or name in seen:
+                    continue
+                seen.add(name)
+                if isinstance(value, depends_cls):
+                    field_depends.append((name, value))
+                elif isinstance(value, types.FunctionType):
+                    meta = value.__dict__.get(_ROUTER_META_KEY)
+                    if meta is not None:
+                        route_methods.append((name, value, meta))
+
+        # Only the field names are needed at request time; freeze them once
+        # so the dispatch handlers never touch the Depends objects
+        depends_names = tuple(field_name for field_name, _ in field_depends)
 
         # Make sure the controller key is not already used
-        assert controller_key not in [field_name for field_name, _ in field_depends]
+        assert controller_key not in depends_names
 
         annotations = kls.__annotations__
 
-        params = []
-
-        # Add all the Depends instances as parameters
-        for field_name, field_value in field_depends:
-            assert (
-                    controller_key != field_name
-            ), f"Depends field name '{field_name}' is reserved for controller instance"
-            parameter = inspect.Parameter(
-                name=field_name,
-                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                default=field_value,
-                annotation=annotations.get(field_name),
-            )
-            params.append(parameter)
+        # Controllers that share the same Depends fields (e.g. subclasses of
+        # a common base) reuse the same parameter tuple
+        depend_key = tuple(
+            (field_name, annotations.get(field_name), id(field_value))
+            for field_name, field_value in field_depends
+        )
+        field_params = _DEPEND_PARAMS_CACHE.get(depend_key)
+
+        if field_params is None:
+            built = []
+
+            # Add all the Depends instances as parameters
+            for field_name, field_value in field_depends:
+                assert (
+                        controller_key != field_name
+                ), f"Depends field name '{field_name}' is reserved for controller instance"
+                annotation = annotations.get(field_name)
+                cache_key = (field_name, annotation, id(field_value))
+                parameter = _PARAM_CACHE.get(cache_key)
+                if parameter is None:
+                    parameter = _PARAM_CACHE[cache_key] = inspect.Parameter(
+                        name=field_name,
+                        kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=field_value,
+                        annotation=annotation,
+                    )
+                built.append(parameter)
+
+            field_params = _DEPEND_PARAMS_CACHE[depend_key] = tuple(built)
+
+        params = list(field_params)
 
         params.append(
             inspect.Parameter(
                 controller_key,
                 inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                default=Depends(kls),
+                default=depends_cls(kls),
             )
         )
 
         depend_signature = inspect.Signature(params)
 
-        # Add all the methods as routes
-        for method_name, method in inspect.getmembers(kls, inspect.isfunction):
-            meta: RouteMeta | None = getattr(method, _ROUTER_META_KEY, None)
-            if not meta:
-                continue
+        # Built here rather than in __init__; still attached even when the
+        # class has no routes so as_api_router keeps working
+        if self._router is None:
+            router_args, router_kwargs = self._router_args
+            self._router = _apirouter()(*router_args, **router_kwargs)
 
-            method_signature = inspect.signature(method)
-            parameters = list(method_signature.parameters.values())[1:] + list(
+        # Add all the methods as routes
+        for method_name, method, meta in route_methods:
+            method_signature = method._orig_sig  # type: ignore[attr-defined]
+            parameters = list(method._method_params) + list(  # type: ignore[attr-defined]
                 depend_signature.parameters.values()
             )
 
-            is_coroutine_function = inspect.iscoroutinefunction(method)
-
-            if is_coroutine_function:
-                @wraps(method)
-                async def router_handler(*args, **kwargs):
-                    """
-                    Closure to handle the route
-                    """
-                    # Get the controller instance
-                    _controller = kwargs.pop(controller_key)
-
-                    # Set all the Depends instances as attributes on the controller
-                    for field_name, _ in field_depends:
-                        setattr(_controller, field_name, kwargs.pop(field_name))
-                    # Call the method
-                    return await method(self=_controller, *args, **kwargs)
-            else:
-                @wraps(method)
-                def router_handler(*args, **kwargs):
-                    """
-                    Closure to handle the route
-                    """
-                    # Get the controller instance
-                    _controller = kwargs.pop(controller_key)
-
-                    # Set all the Depends instances as attributes on the controller
-                    for field_name, _ in field_depends:
-                        setattr(_controller, field_name, kwargs.pop(field_name))
-                    # Call the method
-                    return method(self=_controller, *args, **kwargs)
-
-            router_handler.__signature__ = method_signature.replace(parameters=parameters)  # type: ignore[attr-defined]
-
-            self._router.add_api_route(
-                meta.path,
-                router_handler,
-                methods=[meta.method],
-                *meta.args,
-                **meta.kwargs,
+            is_coroutine_function = method._is_coro  # type: ignore[attr-defined]
+
+            # Bind the method to the shared dispatch handler instead of
+            # defining a fresh closure per route
+            router_handler = partial(
+                _async_dispatch if is_coroutine_function else _sync_dispatch,
+                method,
+                depends_names,
+                controller_key,
+            )
+            # Copy only the attributes fastapi's router actually reads
+            router_handler.__name__ = method.__name__  # type: ignore[attr-defined]
+            router_handler.__qualname__ = method.__qualname__  # type: ignore[attr-defined]
+            router_handler.__doc__ = method.__doc__
+            router_handler.__signature__ = _fast_signature(  # type: ignore[attr-defined]
+                parameters, method_signature.return_annotation
             )
 
+            if meta.args or meta.kwargs:
+                self._router.add_api_route(
+                    meta.path,
+                    router_handler,
+                    *meta.args,
+                    methods=_METHOD_LISTS[meta.method],
+                    **meta.kwargs,
+                )
+            else:
+                self._router.add_api_route(
+                    meta.path,
+                    router_handler,
+                    methods=_METHOD_LISTS[meta.method],
+                )
+
         setattr(kls, _CONTROLLER_ROUTER_KEY, self._router)
 
         return kls
@@ -143,29 +292,34 @@ def as_api_router(_controller: object) -> APIRouter:
     """
     Get the APIRouter instance from a controller
     """
-    assert is_controller(_controller), "Object must be decorated with @Controller"
+    assert hasattr(
+        _controller, _CONTROLLER_ROUTER_KEY
+    ), "Object must be decorated with @Controller"
     return getattr(_controller, _CONTROLLER_ROUTER_KEY)
 
 
+_ALLOWED_METHODS = frozenset({
+    "GET",
+    "POST",
+    "PUT",
+    "DELETE",
+    "PATCH",
+    "OPTIONS",
+    "HEAD",
+    "TRACE",
+})
+
+
 class Method:
     """
     Decorate a function as a route with a specific HTTP method
     """
-    allowed_methods = [
-        "GET",
-        "POST",
-        "PUT",
-        "DELETE",
-        "PATCH",
-        "OPTIONS",
-        "HEAD",
-        "TRACE",
-    ]
+    allowed_methods = _ALLOWED_METHODS
 
     def __init__(self, method: str):
         assert (
-                method in self.allowed_methods
-        ), f"Method must be one of {self.allowed_methods}"
+                method in _ALLOWED_METHODS
+        ), f"Method must be one of {sorted(_ALLOWED_METHODS)}"
         self.method = method
 
     @overload
@@ -191,22 +345,22 @@ class Method:
         """
         Create a route from a path and function
         """
-        is_coroutine_function = inspect.iscoroutinefunction(func)
+        meta = RouteMeta(method=self.method, path=path, args=args, kwargs=kwargs)
+        setattr(func, _ROUTER_META_KEY, meta)
+        func._is_coro = inspect.iscoroutinefunction(func)
 
-        if is_coroutine_function:
-            @wraps(func)
-            async def inner(*inner_args, **inner_kwargs):
-                return await func(*inner_args, **inner_kwargs)
-        else:
-            @wraps(func)
-            def inner(*inner_args, **inner_kwargs):
-                return func(*inner_args, **inner_kwargs)
+        # Inspect the signature once here so Controller.__call__ does not
+        # have to re-run it per route
+        signature = inspect.signature(func)
+        func._orig_sig = signature
+        func._method_params = tuple(signature.parameters.values())[1:]
 
-        meta = RouteMeta(method=self.method, path=path, args=args, kwargs=kwargs)
-        setattr(inner, _ROUTER_META_KEY, meta)
+        return func
 
-        return inner
 
+# Shared single-verb lists for add_api_route; starlette copies them into a
+# set, so one list per verb can serve every route
+_METHOD_LISTS = {m: [m] for m in Method.allowed_methods}
 
 get = Method("GET")
 